@@ -1,18 +1,18 @@
 from __future__ import annotations
 
 import asyncio
+import calendar
 import datetime
 import json
 import logging
+import re
 from collections import defaultdict
 
 import discord
-from dateutil.parser import ParserError
 from dateutil.parser import parse as time_parser
 from redbot.core import commands
 from redbot.core.commands import CheckFailure
 from redbot.core.data_manager import cog_data_path
-from redbot.core.utils import AsyncIter
 from redbot.core.utils.chat_formatting import warning
 from redbot.core.utils.menus import start_adding_reactions
 from redbot.core.utils.predicates import MessagePredicate, ReactionPredicate
@@ -24,8 +24,35 @@ from .converters import BirthdayConverter, TimeConverter
 from .utils import format_bday_message
 from .vexutils import no_colour_rich_markup
 
+# not a hard requirement, but it's much faster for the large migration file
+try:
+    import orjson
+
+    use_orjson = True
+except ImportError:
+    use_orjson = False
+
 log = logging.getLogger("red.vex.birthday.commands")
 
+# days before the start of each month in a non-leap year
+CUMULATIVE_DAYS = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+# "January 01" style labels for every day, 2000 was a leap year so Feb 29 is included
+MONTH_DAY_LABELS = {
+    (month, day): datetime.date(2000, month, day).strftime("%B %d")
+    for month in range(1, 13)
+    for day in range(1, calendar.monthrange(2000, month)[1] + 1)
+}
+
+# midnight on the date TimeConverter gives, to get seconds past midnight
+MIDNIGHT = datetime.datetime(year=1, month=1, day=1)
+
+# fast path for common times like 7:00, 19:30:00, 12AM or 3:15 pm UTC, anything else that doesn't
+# match is given to dateutil
+TIME_RE = re.compile(
+    r"^\s*(\d{1,2})(?::([0-5]\d)(?::[0-5]\d)?)?(?:\s*([AaPp][Mm]))?(?:\s+UTC)?\s*$"
+)
+
 
 class BirthdayCommands(MixinMeta):
     async def setup_check(self, ctx: commands.Context) -> None:
@@ -68,10 +95,13 @@ class BirthdayCommands(MixinMeta):
             await ctx.send("You can't be born in the future!")
             return
 
-        async with self.config.member(ctx.author).birthday() as bday:
-            bday["year"] = birthday.year if birthday.year != 1 else None
-            bday["month"] = birthday.month
-            bday["day"] = birthday.day
+        await self.config.member(ctx.author).birthday.set(
+            {
+                "year": birthday.year if birthday.year != 1 else None,
+                "month": birthday.month,
+                "day": birthday.day,
+            }
+        )
 
         if birthday.year == 1:
             str_bday = birthday.strftime("%B %d")
@@ -113,67 +143,78 @@ class BirthdayCommands(MixinMeta):
             await ctx.send("You must enter a number of days greater than 0 and smaller than 365.")
             return
 
-        today_dt = datetime.datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        today_dt = datetime.datetime.utcnow()
 
         all_birthdays: dict[int, dict[str, dict]] = await self.config.all_members(ctx.guild)
 
-        parsed_bdays: dict[int, list[str]] = defaultdict(list)
-        number_day_mapping: dict[int, str] = {}
-
-        async for member_id, member_data in AsyncIter(all_birthdays.items(), steps=50):
-            member = ctx.guild.get_member(member_id)
-            if not isinstance(member, discord.Member):
+        # indexed by the number of days until the birthday
+        parsed_bdays: list[list[str]] = [[] for _ in range(days + 1)]
+        day_labels: list[str] = [""] * (days + 1)
+
+        # all data is already in memory, no need to yield to the event loop while iterating
+        today_month = today_dt.month
+        today_day = today_dt.day
+        today_year = today_dt.year
+        # this is what Guild.get_member looks up, without the method call for every birthday
+        guild_members: dict[int, discord.Member] = ctx.guild._members
+
+        # work in days of the year rather than building datetimes for every member
+        this_year_leap = calendar.isleap(today_year)
+        next_year_leap = calendar.isleap(today_year + 1)
+        today_ord = CUMULATIVE_DAYS[today_month - 1] + today_day
+        if this_year_leap and today_month > 2:
+            today_ord += 1
+        days_left_in_year = (366 if this_year_leap else 365) - today_ord
+
+        for member_id, member_data in all_birthdays.items():
+            month = member_data["birthday"]["month"]
+            day = member_data["birthday"]["day"]
+
+            # most members are outside the window, so filter them out before doing anything else
+            if today_month == month and today_day == day:
+                diff_days = 0
+            else:
+                bday_ord = CUMULATIVE_DAYS[month - 1] + day
+                this_year_ord = bday_ord + (1 if this_year_leap and month > 2 else 0)
+                if this_year_ord > today_ord:
+                    diff_days = this_year_ord - today_ord
+                else:
+                    next_year_ord = bday_ord + (1 if next_year_leap and month > 2 else 0)
+                    diff_days = days_left_in_year + next_year_ord
+
+                if diff_days > days:
+                    continue
+
+            member = guild_members.get(member_id)
+            if member is None:
                 continue
 
-            birthday_dt = datetime.datetime(
-                year=member_data["birthday"]["year"] or 1,
-                month=member_data["birthday"]["month"],
-                day=member_data["birthday"]["day"],
-            )
+            year = member_data["birthday"]["year"] or 1
 
-            if today_dt.month == birthday_dt.month and today_dt.day == birthday_dt.day:
+            if diff_days == 0:
                 parsed_bdays[0].append(
-                    member.mention
-                    + (
-                        ""
-                        if birthday_dt.year == 1
-                        else f" turns {today_dt.year - birthday_dt.year}"
-                    )
+                    member.mention + ("" if year == 1 else f" turns {today_year - year}")
                 )
-                number_day_mapping[0] = "Today"
-                continue
-
-            this_year_bday = birthday_dt.replace(year=today_dt.year)
-            next_year_bday = birthday_dt.replace(year=today_dt.year + 1)
-            next_birthday_dt = this_year_bday if this_year_bday > today_dt else next_year_bday
-
-            diff = next_birthday_dt - today_dt
-            if diff.days > days:
-                continue
-
-            parsed_bdays[diff.days].append(
-                member.mention
-                + (
-                    ""
-                    if birthday_dt.year == 1
-                    else f" will turn {today_dt.year - birthday_dt.year}"
+                day_labels[0] = "Today"
+            else:
+                parsed_bdays[diff_days].append(
+                    member.mention + ("" if year == 1 else f" will turn {today_year - year}")
                 )
-            )
-            number_day_mapping[diff.days] = next_birthday_dt.strftime("%B %d")
+                day_labels[diff_days] = MONTH_DAY_LABELS[(month, day)]
+
+        populated_days = [day for day, members in enumerate(parsed_bdays) if members]
 
-        if len(parsed_bdays) == 0:
+        if not populated_days:
             await ctx.send("No upcoming birthdays.")
             return
 
-        sorted_parsed_bdays = sorted(parsed_bdays.items(), key=lambda x: x[0])
-
         embed = discord.Embed(title="Upcoming Birthdays", colour=await ctx.embed_colour())
 
-        if len(parsed_bdays) > 25:
+        if len(populated_days) > 25:
             embed.description = "Too many days to display. I've had to stop at 25."
 
-        for day, members in sorted_parsed_bdays:
-            embed.add_field(name=number_day_mapping.get(day), value="\n".join(members))
+        for day in populated_days[:25]:
+            embed.add_field(name=day_labels[day], value="\n".join(parsed_bdays[day]))
 
         await ctx.send(embed=embed)
 
@@ -332,9 +373,20 @@ class BirthdayAdminCommands(MixinMeta):
             if m.author == ctx.author and m.channel == ctx.channel is False:
                 return False
 
+            match = TIME_RE.match(m.content)
+            if match is not None:
+                hour_str, minute_str, am_pm = match.groups()
+                # dateutil would read a bare number as a day of the month
+                if minute_str is None and am_pm is None:
+                    return False
+
+                if am_pm is None:
+                    return int(hour_str) <= 23
+                return 1 <= int(hour_str) <= 12
+
             try:
                 time_parser(m.content)
-            except ParserError:
+            except (ValueError, OverflowError):  # ParserError is a ValueError
                 return False
 
             return True
@@ -352,15 +404,10 @@ class BirthdayAdminCommands(MixinMeta):
                 f"Took too long to react, cancelling setup. Run `{ctx.clean_prefix}bdset"
                 " interactive` to start again."
             )
+            return
 
         full_time = time_parser(ret.content)  # type:ignore
-        full_time = full_time.replace(tzinfo=datetime.timezone.utc, year=1, month=1, day=1)
-
-        midnight = datetime.datetime.now(tz=datetime.timezone.utc).replace(
-            year=1, month=1, day=1, hour=0, minute=0, second=0, microsecond=0
-        )
-
-        time_utc_s = int((full_time - midnight).total_seconds())
+        time_utc_s = full_time.hour * 3600 + full_time.minute * 60 + full_time.second
 
         await ctx.trigger_typing()
 
@@ -384,27 +431,24 @@ class BirthdayAdminCommands(MixinMeta):
         """View your current settings"""
         table = Table("Name", "Value", title="Settings for this server")
 
-        async with self.config.guild(ctx.guild).all() as conf:
-            channel = ctx.guild.get_channel(conf["channel_id"])
-            table.add_row("Channel", channel.name if channel else "Channel deleted")
+        conf = await self.config.guild(ctx.guild).all()
 
-            role = ctx.guild.get_role(conf["role_id"])
-            table.add_row("Role", role.name if role else "Role deleted")
+        channel = ctx.guild.get_channel(conf["channel_id"])
+        table.add_row("Channel", channel.name if channel else "Channel deleted")
 
-            time = datetime.datetime.utcfromtimestamp(conf["time_utc_s"]).strftime("%H:%M UTC")
-            table.add_row("Time", time)
+        role = ctx.guild.get_role(conf["role_id"])
+        table.add_row("Role", role.name if role else "Role deleted")
 
-            message_w_year = conf["message_w_year"] or "No message set"
-            message_wo_year = conf["message_wo_year"] or "No message set"
+        time = datetime.datetime.utcfromtimestamp(conf["time_utc_s"]).strftime("%H:%M UTC")
+        table.add_row("Time", time)
+
+        message_w_year = conf["message_w_year"] or "No message set"
+        message_wo_year = conf["message_wo_year"] or "No message set"
 
         final_table = no_colour_rich_markup(table)
         message = (
-            final_table
-            + "\nMessage with year:\n```"
-            + message_w_year
-            + "```\nMessage without year:\n```"
-            + message_wo_year
-            + "```"
+            f"{final_table}\nMessage with year:\n```{message_w_year}```"
+            f"\nMessage without year:\n```{message_wo_year}```"
         )
         await ctx.send(message)
 
@@ -420,11 +464,7 @@ class BirthdayAdminCommands(MixinMeta):
             - `[p]bdset time 12AM` - set the time to midnight UTC
             - `[p]bdset time 3PM` - set the time to 3:00PM UTC
         """
-        midnight = datetime.datetime.utcnow().replace(
-            year=1, month=1, day=1, hour=0, minute=0, second=0, microsecond=0
-        )
-
-        time_utc_s = int((time - midnight).total_seconds())
+        time_utc_s = int((time - MIDNIGHT).total_seconds())
 
         async with self.config.guild(ctx.guild).all() as conf:
             old = conf["time_utc_s"]
@@ -570,10 +610,13 @@ class BirthdayAdminCommands(MixinMeta):
             await ctx.send("You can't be born in the future!")
             return
 
-        async with self.config.member(user).birthday() as bday:
-            bday["year"] = birthday.year if birthday.year != 1 else None
-            bday["month"] = birthday.month
-            bday["day"] = birthday.day
+        await self.config.member(user).birthday.set(
+            {
+                "year": birthday.year if birthday.year != 1 else None,
+                "month": birthday.month,
+                "day": birthday.day,
+            }
+        )
 
         if birthday.year == 1:
             str_bday = birthday.strftime("%B %d")
@@ -607,15 +650,16 @@ class BirthdayAdminCommands(MixinMeta):
                 return
 
         ze_datapath = cog_data_path(raw_name="Birthdays") / "settings.json"
-        with ze_datapath.open("r") as fp:
-            data = fp.read()
+        with ze_datapath.open("rb") as fp:
+            raw_data = fp.read()
 
-        data = json.loads(data).get(
+        data = (orjson.loads(raw_data) if use_orjson else json.loads(raw_data)).get(
             "4029073447917144423054259634495452608643663801867012607579937291642696830925600898581"
             "468610241444437790345710548026575313281401238342705437492295956906331"
             # thats one long identifier
         )
 
+        guild_writes = []
         for guild_id, guild_data in data.get("GUILD").items():
             guild = self.bot.get_guild(int(guild_id))
             if guild is None:
@@ -629,8 +673,12 @@ class BirthdayAdminCommands(MixinMeta):
                 "time_utc_s": 0,  # UTC midnight
                 "setup_state": 5,
             }
-            await self.config.guild(guild).set_raw(value=new_data)
+            guild_writes.append(self.config.guild(guild).set_raw(value=new_data))
+
+        await asyncio.gather(*guild_writes)
 
+        # collect everything first so each guild's members are written in one go
+        pending: dict[str, dict[str, dict]] = defaultdict(dict)
         for guild_id, guild_data in data.get("GUILD_DATE").items():
             for day, users in guild_data.items():
                 for user_id, year in users.items():
@@ -649,7 +697,13 @@ class BirthdayAdminCommands(MixinMeta):
                         "month": dt.month,
                         "day": dt.day,
                     }
-                    await self.config.member_from_ids(guild_id, user_id).birthday.set(new_data)
+                    pending[guild_id][user_id] = {"birthday": new_data}
+
+        async def update_members(guild_id: str, members: dict[str, dict]) -> None:
+            async with self.config._get_base_group(self.config.MEMBER, guild_id)() as conf:
+                conf.update(members)
+
+        await asyncio.gather(*(update_members(g_id, m) for g_id, m in pending.items()))
 
         await ctx.send(
             "All set. You can now configure the messages and time to send with other commands"
@@ -1,13 +1,24 @@
 from __future__ import annotations
 
+import re
+
 from discord import Member
 
+PLACEHOLDER_RE = re.compile(r"\{\{|\}\}|\{(mention|name|new_age)\}")
+
 
 def format_bday_message(message: str, author: Member, new_age: int | None = None) -> str:
     """
     Formats the birthday message.
+
+    Supports the `{mention}`, `{name}` and `{new_age}` placeholders, and `{{`/`}}` for literal
+    braces like `str.format`. Unknown placeholders, or `{new_age}` when no age is given, are left
+    as they are.
     """
+    replacements = {"{{": "{", "}}": "}", "mention": author.mention, "name": author.display_name}
     if new_age:
-        return message.format(mention=author.mention, name=author.display_name, new_age=new_age)
-    else:
-        return message.format(mention=author.mention, name=author.display_name)
+        replacements["new_age"] = str(new_age)
+
+    return PLACEHOLDER_RE.sub(
+        lambda m: replacements.get(m.group(1) or m.group(0), m.group(0)), message
+    )
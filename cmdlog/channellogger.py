@@ -1,6 +1,6 @@
 import asyncio
-import datetime
 import logging
+import time
 from asyncio import Queue
 from typing import Optional
 
@@ -23,7 +23,8 @@ class ChannelLogger:
 
         self._loop_meta = VexLoop("CmdLog channels", 60.0)
 
-        self.last_send = self._utc_now() - datetime.timedelta(seconds=65)
+        # monotonic as this is only used to space out sends
+        self.last_send = time.monotonic() - 65
         # basically make next sendable time now
 
         self._queue: Queue[LogMixin] = Queue()
@@ -41,10 +42,6 @@ class ChannelLogger:
     def add_command(self, command: LogMixin):
         self._queue.put_nowait(command)
 
-    @staticmethod
-    def _utc_now() -> datetime.datetime:
-        return datetime.datetime.now(datetime.timezone.utc)
-
     async def _cmdlog_channel_task(self) -> None:
         log.debug("CmdLog channel logger task started.")
         while True:
@@ -54,7 +51,7 @@ class ChannelLogger:
                 while self._queue.empty() is False:
                     to_send.append(self._queue.get_nowait())
 
-                self.last_send = self._utc_now()
+                self.last_send = time.monotonic()
 
                 msg = "\n".join(str(i) for i in to_send)
                 for page in pagify(msg):
@@ -69,8 +66,7 @@ class ChannelLogger:
                 )
 
     async def _wait_to_next_safe_send_time(self) -> None:
-        now = self._utc_now()
-        last_send = (now - self.last_send).total_seconds()
+        last_send = time.monotonic() - self.last_send
 
         if last_send < 60:
             to_wait = 60 - last_send
@@ -358,7 +358,7 @@ class CmdLog(commands.Cog):
     async def full(self, ctx: commands.Context):
         """Upload all the logs that are stored in the cache."""
         now = datetime.datetime.now().strftime(TIME_FORMAT)
-        logs = [f"[{i.time}] {i}" for i in self.log_cache]
+        logs = [f"[{i.formatted_time}] {i}" for i in self.log_cache]
         log_str = f"Generated at {now}.\n" + "\n".join(logs)
         fp = StringIO()
         fp.write(log_str)
@@ -391,7 +391,7 @@ class CmdLog(commands.Cog):
             - `[p]cmdlog user 418078199982063626`
         """
         now = datetime.datetime.now().strftime(TIME_FORMAT)
-        logs = [f"[{i.time}] {i}" for i in self.log_cache if i.user.id == user_id]
+        logs = [f"[{i.formatted_time}] {i}" for i in self.log_cache if i.user.id == user_id]
         log_str = f"Generated at {now} for user {user_id}.\n" + (
             "\n".join(logs) or "It looks like I didn't find anything for that user."
         )  # happy doing this because of file previews
@@ -427,7 +427,11 @@ class CmdLog(commands.Cog):
             - `[p]cmdlog server 527961662716772392`
         """
         now = datetime.datetime.now().strftime(TIME_FORMAT)
-        logs = [f"[{i.time}] {i}" for i in self.log_cache if i.guild and i.guild.id == server_id]
+        logs = [
+            f"[{i.formatted_time}] {i}"
+            for i in self.log_cache
+            if i.guild and i.guild.id == server_id
+        ]
 
         log_str = f"Generated at {now} for server {server_id}.\n" + (
             "\n".join(logs) or "It looks like I didn't find anything for that user."
@@ -473,7 +477,9 @@ class CmdLog(commands.Cog):
         # not checking if a command exists because want to allow for this to find it if it was
         # unloaded (eg if com was found to be intensive, see if it was one user spamming it)
         now = datetime.datetime.now().strftime(TIME_FORMAT)
-        logs = [f"[{i.time}] {i}" for i in self.log_cache if i.command.startswith(command)]
+        logs = [
+            f"[{i.formatted_time}] {i}" for i in self.log_cache if i.command.startswith(command)
+        ]
 
         log_str = f"Generated at {now} for command '{command}'.\n" + (
             "\n".join(logs) or "It looks like I didn't find anything for that command."
@@ -1,7 +1,8 @@
 import datetime
-from dataclasses import dataclass
+import functools
+import time
 from sys import getsizeof
-from typing import Optional, Union
+from typing import NamedTuple, Optional, Union
 
 import discord
 from discord.channel import DMChannel, TextChannel
@@ -10,8 +11,7 @@ from discord.guild import Guild
 TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 
-@dataclass()
-class IDFKWhatToNameThis:
+class IDName(NamedTuple):
     id: int
     name: str
 
@@ -20,12 +20,31 @@ class IDFKWhatToNameThis:
         return getsizeof(self.id) + getsizeof(self.name)
 
 
+# tuples can't be weakly referenced so this is a bounded LRU cache instead of a WeakValueDictionary
+@functools.lru_cache(maxsize=4096)
+def _shared_idname(id: int, name: str) -> IDName:
+    """Get an IDName, shared with other log entries in the same channel/guild"""
+    return IDName(id=id, name=name)
+
+
 # TODO: remove the mixin... now application commands exist it's too convoluted
 
 
 class LogMixin:
     """Base for logged data"""
 
+    __slots__ = (
+        "command",
+        "user",
+        "msg_id",
+        "channel",
+        "guild",
+        "content",
+        "app_type",
+        "target",
+        "time",
+    )
+
     def __init__(
         self,
         author: Optional[discord.User],
@@ -43,34 +62,39 @@ class LogMixin:
 
         # ALL COMMANDS
         self.command = com_name
-        self.user = IDFKWhatToNameThis(id=author.id, name=f"{author.name}#{author.discriminator}")
+        self.user = IDName(id=author.id, name=str(author))
 
         # TEXT COMMANDS
-        if msg_id:
-            self.msg_id = msg_id
-        self.channel: Optional[IDFKWhatToNameThis] = None
-        self.guild: Optional[IDFKWhatToNameThis] = None
+        self.msg_id = msg_id
+        self.channel: Optional[IDName] = None
+        self.guild: Optional[IDName] = None
         if guild and channel:
             assert not isinstance(channel, DMChannel)
-            self.channel = IDFKWhatToNameThis(id=channel.id, name=f"#{channel.name}")
-            self.guild = IDFKWhatToNameThis(id=guild.id, name=guild.name)
+            self.channel = _shared_idname(channel.id, f"#{channel.name}")
+            self.guild = _shared_idname(guild.id, guild.name)
         self.content: Optional[str] = None
         if log_content and content is not None:
             self.content = content
 
         # USER/MESSAGE COMMANDS
         self.app_type = application_command
-        self.target: Optional[IDFKWhatToNameThis] = None
+        self.target: Optional[IDName] = None
 
         if isinstance(target, discord.User):
             t_name = target.name if isinstance(target, discord.User) else ""
-            self.target = IDFKWhatToNameThis(id=target.id, name=t_name)
+            self.target = IDName(id=target.id, name=t_name)
 
-        self.time = datetime.datetime.now().strftime(TIME_FORMAT)
+        # formatting is deferred to formatted_time as most entries are never displayed
+        self.time = time.time()
 
     def __str__(self) -> str:
         raise NotImplementedError()
 
+    @property
+    def formatted_time(self) -> str:
+        """The local time this was logged at, formatted with TIME_FORMAT"""
+        return datetime.datetime.fromtimestamp(self.time).strftime(TIME_FORMAT)
+
     def __sizeof__(self) -> int:
         # using getsizeof here will include other stuff eg garbage
         size = 0
@@ -89,6 +113,8 @@ class LogMixin:
 class LoggedCommand(LogMixin):
     """Inherits from LogMixin, for a logged command"""
 
+    __slots__ = ()
+
     def __str__(self) -> str:  # this is what is logged locally
         com = self.content or self.command
         if not self.guild or not self.channel:
@@ -105,6 +131,8 @@ class LoggedCommand(LogMixin):
 class LoggedComError(LogMixin):
     """Inherits from LogMixin, for a logged error"""
 
+    __slots__ = ()
+
     def __str__(self) -> str:  # this is what is logged locally
         com = self.content or self.command
         if not self.guild or not self.channel:
@@ -124,6 +152,8 @@ class LoggedComError(LogMixin):
 class LoggedAppCom(LogMixin):
     """Inherits from LogMixin, for a logged Application Command."""
 
+    __slots__ = ()
+
     def __str__(self) -> str:  # this is what's logged locally
         assert self.app_type is not None
 
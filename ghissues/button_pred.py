@@ -1,16 +1,15 @@
 import asyncio
-from dataclasses import dataclass
-from typing import Any, List, Optional
+from collections import Counter
+from typing import Any, List, NamedTuple, Optional, Set
 
-from discord import ButtonStyle, Embed, Interaction, ui
+from discord import ButtonStyle, Embed, HTTPException, Interaction, ui
 from redbot.core import commands
 
 # THIS FILE IS MAINLY PREDICATES THAT WILL BE MOVED TO VEX-COG-UTILS AT SOME POINT
 # THEY ARE HERE FOR EASIER TESTING AND WHILE DPY2 IS NOT OUT YET THEY WILL LIKELY REMAIN HERE
 
 
-@dataclass
-class PredItem:
+class PredItem(NamedTuple):
     """
     `ref` is what you want to be returned from the predicate if this button is clicked, though it
     cannot be None
@@ -27,35 +26,51 @@ class PredItem:
 
 
 class _PredView(ui.View):
+    __slots__ = ("ref", "author_id", "_reply_tasks")
+
     def __init__(self, timeout: Optional[float], author_id: int):
         super().__init__(timeout=timeout)
         self.ref: Any = None
         self.author_id = author_id
+        # keep a reference to reply tasks so they aren't garbage collected before finishing
+        self._reply_tasks: Set[asyncio.Task] = set()
 
     async def interaction_check(self, interaction: Interaction) -> bool:
         if interaction.user.id == self.author_id:
             return True
 
-        await interaction.response.send_message(
-            "You don't have have permission to do this.", ephemeral=True
+        # no need to hold up the check on telling them off
+        task = asyncio.create_task(
+            interaction.response.send_message(
+                "You don't have have permission to do this.", ephemeral=True
+            )
         )
+        self._reply_tasks.add(task)
+        task.add_done_callback(self._reply_tasks.discard)
         return False
 
 
 class _PredButton(ui.Button):
+    __slots__ = ("ref",)
+
     def __init__(self, ref: Any, style: ButtonStyle, label: str, row: Optional[int] = None):
         super().__init__(style=style, label=label, row=row)
         self.ref = ref
 
     async def callback(self, interaction: Interaction):
-        self.view.stop()
         self.view.ref = self.ref
+        self.view.stop()
+
+        # acknowledge so Discord doesn't show the interaction as failed, the press has already
+        # been registered above if this fails (eg it's past the 3 second window)
+        try:
+            await interaction.response.defer()
+        except HTTPException:
+            pass
 
 
-async def _press_wait(view: _PredView) -> None:
-    while view.ref is None:
-        await asyncio.sleep(0.05)
-    return
+_YES = PredItem(True, ButtonStyle.blurple, "Yes")
+_NO = PredItem(False, ButtonStyle.blurple, "No")
 
 
 async def wait_for_press(
@@ -91,22 +106,35 @@ async def wait_for_press(
     Raises
     ------
     ValueError
-        An empty list was supplied
+        An empty list was supplied, or the items won't fit in a message's 5 rows of 5 buttons
     asyncio.TimeoutError
         A button was not pressed in time.
     """
     if not items:
         raise ValueError("The `items` argument cannot contain an empty list.")
+    if len(items) > 25:
+        raise ValueError("The `items` argument cannot contain more than 25 items.")
+
+    # check now, rather than discord.py raising part way through building the view
+    row_counts = Counter(i.row for i in items if i.row is not None)
+    for row, count in row_counts.items():
+        if not 0 <= row <= 4:
+            raise ValueError(f"Item rows must be between 0 and 4, not {row}.")
+        if count > 5:
+            raise ValueError(f"Row {row} cannot contain more than 5 items.")
 
     view = _PredView(timeout, ctx.author.id)
 
-    for i in items:
-        button = _PredButton(i.ref, i.style, i.label, i.row)
-        view.add_item(button)
+    buttons = [_PredButton(i.ref, i.style, i.label, i.row) for i in items]
+    add_item = view.add_item
+    for button in buttons:
+        add_item(button)
 
     await ctx.send(content=content, embed=embed, view=view)
 
-    await asyncio.wait_for(_press_wait(view), timeout=timeout)
+    # View.wait returns True if the view timed out before being stopped by a button
+    if await view.wait():
+        raise asyncio.TimeoutError()
     return view.ref
 
 
@@ -147,10 +175,12 @@ async def wait_for_yes_no(
     """
     view = _PredView(timeout, ctx.author.id)
 
-    view.add_item(_PredButton(True, ButtonStyle.blurple, "Yes"))
-    view.add_item(_PredButton(False, ButtonStyle.blurple, "No"))
+    view.add_item(_PredButton(*_YES))
+    view.add_item(_PredButton(*_NO))
 
     await ctx.send(content=content, embed=embed, view=view)
 
-    await asyncio.wait_for(_press_wait(view), timeout=timeout)
+    # View.wait returns True if the view timed out before being stopped by a button
+    if await view.wait():
+        raise asyncio.TimeoutError()
     return view.ref
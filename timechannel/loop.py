@@ -55,7 +55,9 @@ class TCLoop(MixinMeta):
             _log.debug("No time channels registered, nothing to do...")
             return
 
-        reps = gen_replacements()
+        # copy so every channel in this pass gets the same time, even if a minute passes while
+        # waiting on ratelimits
+        reps = dict(gen_replacements())
 
         for guild_id, guild_data in all_guilds.items():
             guild = self.bot.get_guild(guild_id)
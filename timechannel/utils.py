@@ -1,17 +1,71 @@
 import datetime
-from typing import Dict
+import time
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 
 import pytz
 
 from .data import ZONE_KEYS
 
+# looking these up is slow, and the zones don't change
+TIMEZONES: Dict[str, datetime.tzinfo] = {
+    key: pytz.timezone(zone) for key, zone in ZONE_KEYS.items()
+}
 
-def gen_replacements() -> Dict[str, str]:
-    replacements: Dict[str, str] = {}
-    for key, zone in ZONE_KEYS.items():
-        foramtted_time = datetime.datetime.now(pytz.timezone(zone)).strftime("%I:%M%p").lstrip("0")
-        replacements[key] = foramtted_time
+# (key, timezone, 24h key) for each zone, so gen_replacements only has to loop over this
+ZONE_ENTRIES: Tuple[Tuple[str, datetime.tzinfo, str], ...] = tuple(
+    (key, tz, f"{key}-24h") for key, tz in TIMEZONES.items()
+)
 
-        formatted_24h_time = datetime.datetime.now(pytz.timezone(zone)).strftime("%H:%M")
-        replacements[f"{key}-24h"] = formatted_24h_time
-    return replacements
+
+# the output only changes once a minute, so this is updated in place when the minute changes
+_replacements: Dict[str, str] = {}
+_replacements_view: Mapping[str, str] = MappingProxyType(_replacements)
+_last_minute: Optional[int] = None
+
+# UTC offset in seconds of each zone in ZONE_ENTRIES, and the 15 minute period they are for. DST
+# changes always happen on a quarter hour in UTC, so they can't change within a period.
+_offsets: List[int] = []
+_offsets_quarter: Optional[int] = None
+
+
+def _get_offsets(now_ts: float) -> List[int]:
+    global _offsets, _offsets_quarter
+
+    quarter = int(now_ts) // 900
+    if quarter != _offsets_quarter:
+        utc_now = datetime.datetime.fromtimestamp(now_ts, datetime.timezone.utc)
+        offsets = []
+        for _, tz, _ in ZONE_ENTRIES:
+            offset = utc_now.astimezone(tz).utcoffset()
+            assert offset is not None
+            offsets.append(int(offset.total_seconds()))
+        _offsets = offsets
+        _offsets_quarter = quarter
+
+    return _offsets
+
+
+def gen_replacements() -> Mapping[str, str]:
+    """Get the current time in each timezone, keyed by short ID (and short ID with `-24h`)
+
+    This is a read-only view that's updated in place every minute. If you keep it across an
+    `await`, copy it with `dict()` first so the times don't change under you.
+    """
+    global _last_minute
+
+    now_ts = time.time()
+    now_s = int(now_ts)
+    minute_bucket = now_s // 60
+    if minute_bucket == _last_minute:
+        return _replacements_view
+
+    replacements = _replacements
+    for (key, _, key_24h), offset in zip(ZONE_ENTRIES, _get_offsets(now_ts)):
+        hour, minute = divmod((now_s + offset) % 86400 // 60, 60)
+        # same as strftime("%I:%M%p").lstrip("0")
+        replacements[key] = f"{hour % 12 or 12}:{minute:02}{'AM' if hour < 12 else 'PM'}"
+        replacements[key_24h] = f"{hour:02}:{minute:02}"
+
+    _last_minute = minute_bucket
+    return _replacements_view